@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 import boto3
 import plotly.graph_objects as go
-from collections import OrderedDict
 import fire
 import logging
-from typing import List, Dict, Tuple, Set
+import functools
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Set, Optional
 from datetime import datetime
 
 # Constants
@@ -12,6 +15,7 @@ SECONDS_IN_HOUR = 3600
 SECONDS_IN_MINUTE = 60
 DEFAULT_PROFILE = "default"
 DEFAULT_REGION = "us-east-2"
+MAX_WORKERS = 8  # Concurrent nested stack retrievals per stack
 DEFAULT_FONT = {"family": "Open Sans, light", "color": "black", "size": 14}
 COLORS = {
     "stack": {
@@ -28,9 +32,33 @@ COLORS = {
     "waiting": "#ECF0F1"          # Light gray for waiting periods
 }
 
+# Reverse lookup of bar color to the category shown in hover text
+_COLOR_TO_CATEGORY = {v: k.title() for k, v in COLORS["resource"].items()}
+_COLOR_TO_CATEGORY[COLORS["stack"]["main"]] = "Main Stack"
+_COLOR_TO_CATEGORY[COLORS["stack"]["nested"]] = "Nested Stack"
+
+# Hover text for each bar segment, filled from the trace customdata
+HOVER_TEMPLATE = (
+    "<b>%{customdata[4]}</b><br>" +  # Logical Resource ID
+    "Type: %{customdata[0]}<br>" +   # Resource Type
+    "Duration: %{customdata[1]}<br>" +
+    "Start: %{customdata[2]}<br>" +
+    "End: %{customdata[3]}<extra></extra>"
+)
+
+# Resource type prefixes for each category, checked in order
+_COMPUTE_RESOURCES = ("AWS::EC2::", "AWS::Lambda::", "AWS::AutoScaling::")
+_STORAGE_RESOURCES = ("AWS::S3::", "AWS::EFS::", "AWS::DynamoDB::", "AWS::RDS::")
+_NETWORK_RESOURCES = ("AWS::EC2::VPC", "AWS::EC2::Subnet", "AWS::EC2::RouteTable",
+                      "AWS::EC2::SecurityGroup", "AWS::ElasticLoadBalancing::")
+_SECURITY_RESOURCES = ("AWS::IAM::", "AWS::KMS::", "AWS::SecretsManager::")
+
 # Initialize a module-level logger
 logger = logging.getLogger("cfplot_logger")
 
+# Guards processed_stacks, which is shared by nested stack worker threads
+_processed_stacks_lock = threading.Lock()
+
 def setup_logging(debug: bool) -> None:
     logger.setLevel(logging.DEBUG if debug else logging.INFO)
     logger.propagate = False  # Prevents the logger from propagating to the root logger
@@ -45,69 +73,82 @@ def format_time_from_seconds(seconds: int) -> str:
     minutes, seconds = divmod(remainder, SECONDS_IN_MINUTE)
     return f"{hours:02}:{minutes:02}:{seconds:02}"
 
+@functools.lru_cache(maxsize=256)
 def get_resource_category(resource_type: str) -> str:
     """
     Determine the category of a resource based on its type
     """
-    compute_resources = {"AWS::EC2::", "AWS::Lambda::", "AWS::AutoScaling::"}
-    storage_resources = {"AWS::S3::", "AWS::EFS::", "AWS::DynamoDB::", "AWS::RDS::"}
-    network_resources = {"AWS::EC2::VPC", "AWS::EC2::Subnet", "AWS::EC2::RouteTable", 
-                        "AWS::EC2::SecurityGroup", "AWS::ElasticLoadBalancing::"}
-    security_resources = {"AWS::IAM::", "AWS::KMS::", "AWS::SecretsManager::"}
-    
-    if any(resource_type.startswith(r) for r in compute_resources):
+    if resource_type.startswith(_COMPUTE_RESOURCES):
         return "compute"
-    elif any(resource_type.startswith(r) for r in storage_resources):
+    elif resource_type.startswith(_STORAGE_RESOURCES):
         return "storage"
-    elif any(resource_type.startswith(r) for r in network_resources):
+    elif resource_type.startswith(_NETWORK_RESOURCES):
         return "network"
-    elif any(resource_type.startswith(r) for r in security_resources):
+    elif resource_type.startswith(_SECURITY_RESOURCES):
         return "security"
     return "other"
 
-def get_stack_creation_events(stackname: str, cf_client) -> Tuple[List[Dict], Dict[str, str], datetime]:
+@functools.lru_cache(maxsize=None)
+def _get_cf_client(profile: str, region: str):
     """
-    Get initial creation events for a single stack and identify nested stacks
+    Build a CloudFormation client once per profile/region and reuse it
+    """
+    session = boto3.session.Session(profile_name=profile, region_name=region)
+    return session.client("cloudformation")
+
+@functools.lru_cache(maxsize=128)
+def _fetch_stack_events(stackname: str, cf_client) -> Tuple[Dict, ...]:
+    """
+    Fetch all events for a stack in chronological order, cached per stack and client
     """
     paginator = cf_client.get_paginator("describe_stack_events")
-    all_events = []
-    for page in paginator.paginate(StackName=stackname):
-        all_events.extend(page["StackEvents"])
+    # Each page is newest-first; reverse them so they can be merged oldest-first
+    pages = [list(reversed(page["StackEvents"])) for page in paginator.paginate(StackName=stackname)]
     
-    # Sort chronologically
-    all_events.sort(key=lambda x: x["Timestamp"])
-    
-    # Debug log the first few events
-    logger.debug(f"First 3 events for stack {stackname}:")
-    for event in all_events[:3]:
-        logger.debug(f"Event: Status={event['ResourceStatus']}, "
-                     f"Type={event['ResourceType']}, "
-                     f"LogicalId={event['LogicalResourceId']}, "
-                     f"Reason={event.get('ResourceStatusReason', 'No reason')}")
+    # Merge the already-sorted pages chronologically instead of re-sorting
+    return tuple(heapq.merge(*pages, key=lambda x: x["Timestamp"]))
+
+def get_stack_creation_events(stackname: str, cf_client) -> Tuple[List[Dict], Dict[str, str], datetime]:
+    """
+    Get initial creation events for a single stack and identify nested stacks
+    """
+    all_events = _fetch_stack_events(stackname, cf_client)
     
-    # For nested stacks, find the first CREATE_IN_PROGRESS and CREATE_COMPLETE events
-    start_event = next(
-        (e for e in all_events 
-         if e["ResourceStatus"] == "CREATE_IN_PROGRESS" 
-         and e["ResourceType"] == "AWS::CloudFormation::Stack"
-         and e.get("ResourceStatusReason", "") == "User Initiated"),
-        None
-    )
+    # Locate the stack's logical ID and start/complete events in a single scan
+    start_event = None
+    complete_event = None
+    stack_logical_id = None
+    start_index = complete_index = 0
+    for index, event in enumerate(all_events):
+        if event["ResourceType"] != "AWS::CloudFormation::Stack":
+            continue
+        # Get the actual logical ID from the stack events
+        if stack_logical_id is None:
+            stack_logical_id = event["LogicalResourceId"]
+        # For nested stacks, find the first CREATE_IN_PROGRESS and CREATE_COMPLETE events
+        if (start_event is None and
+            event["ResourceStatus"] == "CREATE_IN_PROGRESS" and
+            event.get("ResourceStatusReason", "") == "User Initiated"):
+            start_event = event
+            start_index = index
+        if (complete_event is None and
+            event["ResourceStatus"] == "CREATE_COMPLETE" and
+            event["LogicalResourceId"] == stack_logical_id):
+            complete_event = event
+            complete_index = index
+        if start_event and complete_event:
+            break  # Nothing later in the history can change either sentinel
     
-    # Get the actual logical ID from the stack events
-    stack_logical_id = next(
-        (e["LogicalResourceId"] for e in all_events 
-         if e["ResourceType"] == "AWS::CloudFormation::Stack"),
-        stackname.split('/')[-1]
-    )
+    if stack_logical_id is None:
+        stack_logical_id = stackname.split('/')[-1]
     
-    complete_event = next(
-        (e for e in all_events 
-         if e["ResourceStatus"] == "CREATE_COMPLETE"
-         and e["ResourceType"] == "AWS::CloudFormation::Stack"
-         and e["LogicalResourceId"] == stack_logical_id),
-        None
-    )
+    # Debug log the first few events
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("First 3 events for stack %s:", stackname)
+        for event in all_events[:3]:
+            logger.debug("Event: Status=%s, Type=%s, LogicalId=%s, Reason=%s",
+                         event['ResourceStatus'], event['ResourceType'],
+                         event['LogicalResourceId'], event.get('ResourceStatusReason', 'No reason'))
     
     if not start_event or not complete_event:
         logger.warning(f"Could not find start or complete event for stack: {stackname}")
@@ -128,26 +169,31 @@ def get_stack_creation_events(stackname: str, cf_client) -> Tuple[List[Dict], Di
     complete_time = complete_event["Timestamp"]
     
     logger.info(f"Found valid start/complete events for {stackname}")
-    logger.debug(f"Start: {start_time}, Complete: {complete_time}")
+    logger.debug("Start: %s, Complete: %s", start_time, complete_time)
     
-    # Track nested stacks and their creation times
+    # Events are chronological, so the creation window is a contiguous slice
+    # bounded by the start/complete events plus any events sharing their timestamps
+    first = start_index
+    while first > 0 and all_events[first - 1]["Timestamp"] >= start_time:
+        first -= 1
+    last = complete_index + 1
+    while last < len(all_events) and all_events[last]["Timestamp"] <= complete_time:
+        last += 1
+    creation_events = list(all_events[first:last])
+    
+    # Track nested stacks and their creation times, in chronological order of first sighting
     nested_stacks = {}
-    creation_events = []
     
-    for event in all_events:
-        # Only include events between stack start and complete
-        if start_time <= event["Timestamp"] <= complete_time:
-            creation_events.append(event)
-            
-            # Track nested stack creation
-            if (event["ResourceType"] == "AWS::CloudFormation::Stack" and 
-                event["PhysicalResourceId"] != stackname and
-                event["ResourceStatus"] == "CREATE_IN_PROGRESS" and
-                event["PhysicalResourceId"]):
-                nested_stacks[event["PhysicalResourceId"]] = event["Timestamp"]
-                logger.debug(f"Detected nested stack: {event['PhysicalResourceId']} "
-                             f"with LogicalId: {event['LogicalResourceId']} "
-                             f"at {event['Timestamp']}")
+    for event in creation_events:
+        # Track nested stack creation
+        if (event["ResourceType"] == "AWS::CloudFormation::Stack" and 
+            event["PhysicalResourceId"] != stackname and
+            event["ResourceStatus"] == "CREATE_IN_PROGRESS" and
+            event["PhysicalResourceId"] and
+            event["PhysicalResourceId"] not in nested_stacks):
+            nested_stacks[event["PhysicalResourceId"]] = event["Timestamp"]
+            logger.debug("Detected nested stack: %s with LogicalId: %s at %s",
+                         event['PhysicalResourceId'], event['LogicalResourceId'], event['Timestamp'])
     
     return creation_events, nested_stacks, complete_time
 
@@ -159,18 +205,12 @@ def retrieve_cf_events(stackname: str, profile: str, region: str, root_complete_
         logger.error("Stack name is required to retrieve events.")
         return []
         
+    # Nested stacks are claimed by the caller before recursing, so only the root needs adding
     if processed_stacks is None:
-        processed_stacks = set()
-        
-    if stackname in processed_stacks:
-        logger.info(f"Stack {stackname} has already been processed.")
-        return []
-        
-    processed_stacks.add(stackname)
+        processed_stacks = {stackname}
     
     logger.info(f"Retrieving events for stack: {stackname}")
-    session = boto3.session.Session(profile_name=profile, region_name=region)
-    cf_client = session.client("cloudformation")
+    cf_client = _get_cf_client(profile, region)
     
     # Get events for this stack and identify nested stacks
     stack_events, nested_stacks, stack_complete_time = get_stack_creation_events(stackname, cf_client)
@@ -183,19 +223,33 @@ def retrieve_cf_events(stackname: str, profile: str, region: str, root_complete_
     
     all_events = stack_events.copy()
     
-    # Process nested stacks in creation order, but only if created before root stack completed
-    for nested_stack, creation_time in sorted(nested_stacks.items(), key=lambda x: x[1]):
-        if nested_stack and creation_time <= complete_time:  # Only process stacks created before root completion
-            logger.debug(f"Processing nested stack: {nested_stack} (created at {creation_time})")
+    # Fetch nested stacks concurrently, but only if created before root stack completed
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = []
+        # nested_stacks is already in creation order, so stop at the first one created after root completion
+        for nested_stack, creation_time in nested_stacks.items():
+            if creation_time > complete_time:
+                break
+            with _processed_stacks_lock:
+                if nested_stack in processed_stacks:
+                    logger.info(f"Stack {nested_stack} has already been processed.")
+                    continue
+                processed_stacks.add(nested_stack)
+            logger.debug("Processing nested stack: %s (created at %s)", nested_stack, creation_time)
+            futures.append((nested_stack, executor.submit(
+                retrieve_cf_events,
+                stackname=nested_stack,
+                profile=profile,
+                region=region,
+                root_complete_time=complete_time,  # Pass down the root completion time
+                processed_stacks=processed_stacks
+            )))
+        
+        # Collect in creation order so the waterfall layout stays deterministic
+        for nested_stack, future in futures:
             try:
-                nested_events = retrieve_cf_events(
-                    stackname=nested_stack,
-                    profile=profile,
-                    region=region,
-                    root_complete_time=complete_time,  # Pass down the root completion time
-                    processed_stacks=processed_stacks
-                )
-                logger.debug(f"Retrieved {len(nested_events)} events from nested stack: {nested_stack}")
+                nested_events = future.result()
+                logger.debug("Retrieved %d events from nested stack: %s", len(nested_events), nested_stack)
                 all_events.extend(nested_events)
             except Exception as e:
                 logger.warning(f"Could not retrieve events for nested stack {nested_stack}: {str(e)}")
@@ -210,6 +264,9 @@ def construct_event_trace(start_time, data, event, is_total=False):
     is_stack = event["ResourceType"] == "AWS::CloudFormation::Stack"
     is_main_stack = is_stack and event["StackName"] == event["LogicalResourceId"]
     resource_category = get_resource_category(event["ResourceType"])
+    color = (COLORS["stack"]["main"] if is_main_stack else
+             COLORS["stack"]["nested"] if is_stack else
+             COLORS["resource"][resource_category])
     
     trace = {
         "x": [],
@@ -217,19 +274,29 @@ def construct_event_trace(start_time, data, event, is_total=False):
         "text": [],
         "textfont": DEFAULT_FONT,
         "textposition": "outside",
-        "width": 0.6,  # Reduced from 0.8 to create more spacing
-        "base": (data["identified"] - start_time).seconds,
+        "width": 0.6,  # Affects how big the duration numbers appear. 0.4 is too small for > 100 resources.
+        "base": int((data["identified"] - start_time).total_seconds()),
         "measure": [],
-        "increasing": {
-            "marker": {
-                "color": COLORS["stack"]["main"] if is_main_stack else
-                        COLORS["stack"]["nested"] if is_stack else
-                        COLORS["resource"][resource_category]
-            }
-        },
-        "decreasing": {"marker": {"color": COLORS["waiting"]}}
+        "increasing": {"marker": {"color": color}},
+        "decreasing": {"marker": {"color": COLORS["waiting"]}},
+        "hovertemplate": HOVER_TEMPLATE
     }
     update_trace(event, trace, is_total, data)
+    
+    # Create meaningful customdata for each bar segment
+    resource_type = _COLOR_TO_CATEGORY.get(color, "Resource")
+    base = trace["base"]
+    start = format_time_from_seconds(base)
+    trace["customdata"] = [
+        [
+            resource_type,
+            format_time_from_seconds(x) if x > 0 else "00:00:00",  # Duration
+            start,
+            format_time_from_seconds(base + x),  # End time
+            logical_id  # Logical Resource ID
+        ]
+        for x, logical_id in zip(trace["x"], trace["y"][1])
+    ]
     return trace
 
 def update_trace(event, trace, is_total, data):
@@ -243,25 +310,25 @@ def update_trace(event, trace, is_total, data):
         trace["x"].append(0)
         trace["measure"].append("relative")
         trace["text"].append("")
-        trace["text"].append(format_time_from_seconds(data["duration"].seconds))
+        trace["text"].append(format_time_from_seconds(data["duration"]))
     else:
         # Add waiting time segment (identification to start)
-        if data["duration_i2s"].seconds > 0:
-            trace["x"].append(data["duration_i2s"].seconds)
+        if data["duration_i2s"] > 0:
+            trace["x"].append(data["duration_i2s"])
             trace["measure"].append("relative")
             trace["text"].append("")
             trace["y"][0].append(event["StackName"])
             trace["y"][1].append(event["LogicalResourceId"])
         
         # Add creation time segment (start to end)
-        trace["x"].append(data["duration_s2e"].seconds)
+        trace["x"].append(data["duration_s2e"])
         trace["measure"].append("relative")
-        trace["text"].append(format_time_from_seconds(data["duration"].seconds))
+        trace["text"].append(format_time_from_seconds(data["duration"]))
 
 def main(stackname: str, profile: str = DEFAULT_PROFILE, region: str = DEFAULT_REGION, debug: bool = False) -> None:
     setup_logging(debug)
     logger.info(f"Starting retrieval of events for stack: {stackname}")
-    data = OrderedDict()
+    data = {}
     fig = go.Figure()
     try:
         events = retrieve_cf_events(stackname=stackname, profile=profile, region=region)
@@ -269,66 +336,67 @@ def main(stackname: str, profile: str = DEFAULT_PROFILE, region: str = DEFAULT_R
             logger.error("No events found for the stack.")
             return
         start_time = events[0]["Timestamp"]
-        process_events(events, start_time, data, fig)
-        display_figure(fig, data, events, stackname)
+        total_duration = process_events(events, start_time, data, fig)
+        display_figure(fig, data, events, stackname, total_duration)
     except Exception as e:
         logger.error(f"An error occurred: {str(e)}")
 
-def process_events(events, start_time, data, fig):
+def process_events(events, start_time, data, fig) -> int:
     """
-    Process events and create waterfall traces
+    Process events and create waterfall traces.
+    Returns the end time in seconds of the last completed resource.
     """
-    # First pass: collect all timing data
-    for event in events:
-        update_data_for_event(event, data)
-    
     # Track which stacks we've already processed
     processed_stacks = set()
-    traces_created = 0
+    traces = []
+    total_duration = 0
     
-    # Second pass: create traces for completed resources
+    # Single pass: collect timing data and create a trace as soon as a resource completes
     for event in events:
+        resource_data = update_data_for_event(event, data)
+        if resource_data is None:
+            continue
+        
         stack_name = event["StackName"]
         logical_id = event["LogicalResourceId"]
         
         # Create a unique identifier for this stack
         stack_identifier = f"{stack_name}/{logical_id}"
         
-        if (event["ResourceStatus"] == "CREATE_COMPLETE" and 
-            stack_name in data and 
-            logical_id in data[stack_name] and 
-            data[stack_name][logical_id]["duration"] is not None):
-            
-            # Skip if we've already processed this stack
-            if stack_identifier in processed_stacks:
-                logger.debug(f"Skipping already processed stack: {stack_identifier}")
-                continue
-            
-            # Skip root stack self-reference
-            if (event["ResourceType"] == "AWS::CloudFormation::Stack" and 
-                stack_name == logical_id):
-                logger.debug(f"Skipping root stack self-reference: {stack_name}")
-                continue
-            
-            trace = construct_event_trace(
-                start_time=start_time,
-                data=data[stack_name][logical_id],
-                event=event
-            )
-            fig.add_trace(go.Waterfall(orientation="h", **trace))
-            traces_created += 1
-            
-            # Mark this stack as processed
-            processed_stacks.add(stack_identifier)
-            
-            if event["ResourceType"] == "AWS::CloudFormation::Stack":
-                logger.debug(f"Created trace for stack: {logical_id}")
+        # Skip if we've already processed this stack
+        if stack_identifier in processed_stacks:
+            logger.debug("Skipping already processed stack: %s", stack_identifier)
+            continue
+        
+        # Skip root stack self-reference
+        if (event["ResourceType"] == "AWS::CloudFormation::Stack" and 
+            stack_name == logical_id):
+            logger.debug("Skipping root stack self-reference: %s", stack_name)
+            continue
+        
+        trace = construct_event_trace(
+            start_time=start_time,
+            data=resource_data,
+            event=event
+        )
+        traces.append(go.Waterfall(orientation="h", **trace))
+        total_duration = max(total_duration, trace["base"] + resource_data["duration"])
+        
+        # Mark this stack as processed
+        processed_stacks.add(stack_identifier)
+        
+        if event["ResourceType"] == "AWS::CloudFormation::Stack":
+            logger.debug("Created trace for stack: %s", logical_id)
     
-    logger.info(f"Created {traces_created} traces for visualization")
+    # Add all traces at once rather than validating the figure per trace
+    fig.add_traces(traces)
+    logger.info(f"Created {len(traces)} traces for visualization")
+    return total_duration
 
-def update_data_for_event(event, data):
+def update_data_for_event(event, data) -> Optional[Dict]:
     """
-    Update the data structure with event information for waterfall visualization
+    Update the data structure with event information for waterfall visualization.
+    Returns the resource data when this event finalized its durations, otherwise None.
     """
     stack_name = event["StackName"]
     logical_resource_id = event["LogicalResourceId"]
@@ -346,9 +414,9 @@ def update_data_for_event(event, data):
             "identified": None,  # When resource is first seen
             "start": None,      # When creation actually starts
             "end": None,        # When creation completes
-            "duration": None,   # Total time from identification to completion
-            "duration_i2s": None,  # Time from identification to start
-            "duration_s2e": None   # Time from start to completion
+            "duration": None,   # Total seconds from identification to completion
+            "duration_i2s": None,  # Seconds from identification to start
+            "duration_s2e": None   # Seconds from start to completion
         }
 
     resource_data = data[stack_name][logical_resource_id]
@@ -375,9 +443,12 @@ def update_data_for_event(event, data):
         
         # Calculate durations only when we have all necessary timestamps
         if resource_data["identified"] and resource_data["start"] and resource_data["end"]:
-            resource_data["duration_i2s"] = resource_data["start"] - resource_data["identified"]
-            resource_data["duration_s2e"] = resource_data["end"] - resource_data["start"]
-            resource_data["duration"] = resource_data["end"] - resource_data["identified"]
+            resource_data["duration_i2s"] = int((resource_data["start"] - resource_data["identified"]).total_seconds())
+            resource_data["duration_s2e"] = int((resource_data["end"] - resource_data["start"]).total_seconds())
+            resource_data["duration"] = int((resource_data["end"] - resource_data["identified"]).total_seconds())
+            return resource_data
+    
+    return None
 
 def format_time_for_axis(seconds: float) -> str:
     """
@@ -386,10 +457,7 @@ def format_time_for_axis(seconds: float) -> str:
     minutes, seconds = divmod(int(seconds), 60)
     return f"{minutes:02}:{seconds:02}"
 
-def display_figure(fig, data, events, stackname):
-    # Calculate total duration in seconds from the first trace's base value
-    total_duration = max(trace.base + sum(trace.x) for trace in fig.data)
-    
+def display_figure(fig, data, events, stackname, total_duration):
     fig.update_layout(
         title={
             "text": f'<span style="color:#2C3E50">CloudFormation Waterfall - {stackname}<br />'
@@ -430,45 +498,6 @@ def display_figure(fig, data, events, stackname):
         )
     )
     
-    for trace in fig.data:
-        # Create meaningful customdata for each bar segment
-        customdata = []
-        for i in range(len(trace.y[0])):
-            resource_type = "Resource"  # Default value
-            if hasattr(trace, 'increasing') and 'marker' in trace.increasing:
-                color = trace.increasing.marker.color
-                if color == COLORS["stack"]["main"]:
-                    resource_type = "Main Stack"
-                elif color == COLORS["stack"]["nested"]:
-                    resource_type = "Nested Stack"
-                elif color in COLORS["resource"].values():
-                    # Reverse lookup the resource category
-                    resource_type = next(
-                        (k.title() for k, v in COLORS["resource"].items() if v == color),
-                        "Resource"
-                    )
-            
-            duration = format_time_from_seconds(trace.x[i]) if trace.x[i] > 0 else "00:00:00"
-            start_time = format_time_from_seconds(trace.base)
-            end_time = format_time_from_seconds(trace.base + trace.x[i])
-            
-            customdata.append([
-                resource_type,
-                duration,
-                start_time,
-                end_time,
-                trace.y[1][i]  # Logical Resource ID
-            ])
-        
-        trace.customdata = customdata
-        trace.hovertemplate = (
-            "<b>%{customdata[4]}</b><br>" +  # Logical Resource ID
-            "Type: %{customdata[0]}<br>" +   # Resource Type
-            "Duration: %{customdata[1]}<br>" +
-            "Start: %{customdata[2]}<br>" +
-            "End: %{customdata[3]}<extra></extra>"
-        )
-    
     fig.update_xaxes(
         title="Event Duration (MM:SS)",
         tickangle=-45,
@@ -484,7 +513,6 @@ def display_figure(fig, data, events, stackname):
     fig.update_traces(
         connector_visible=False,
         textfont={"color": "#2C3E50"},
-        width=0.6, # This affects how big the duration numbers appear. 0.4 is too small for > 100 resources.
         alignmentgroup="resource",
         offsetgroup="resource"
     )